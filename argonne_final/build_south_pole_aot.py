@@ -0,0 +1,86 @@
+"""
+Ahead-of-time build script for the south_pole_traverse kernels.
+
+Compiles the hot emissions kernels into a `south_pole_aot` extension module with
+numba.pycc, so production batch jobs pay zero JIT compile latency at runtime.
+south_pole_traverse imports the extension automatically when it is present and
+falls back to its own @njit (or plain Python) kernels otherwise.
+
+Usage:
+    python build_south_pole_aot.py
+
+The kernel bodies mirror the @njit kernels in south_pole_traverse and share its
+precomputed module-level coefficients, so the two implementations cannot drift
+apart numerically.
+"""
+
+import numpy as np
+from numba.pycc import CC
+
+from south_pole_traverse import (
+    _DIESEL_PRODUCTION_GRAMS_PER_GALLON,
+    _FUELUSED_GRAMS_PER_MILE_TANKER,
+    _FUELUSED_GRAMS_PER_MILE_TRUCK,
+    _SCENARIO_TANKER_GRAMS_FIXED,
+    _SCENARIO_TANKER_GRAMS_PER_TON,
+    _TANKER_GRAMS_PER_BACKHAUL_MILE,
+    _TANKER_GRAMS_PER_TONMILE,
+    _TRUCK_GRAMS_PER_EMPTY_MILE,
+    _TRUCK_GRAMS_PER_TONMILE,
+)
+
+cc = CC('south_pole_aot')
+
+
+@cc.export('truck_emissions', 'f8[:](f8, f8, f8)')
+def truck_emissions(miles, cargo_weight_in_tons, quantity):
+    trip_miles = miles * quantity
+    emissions = np.empty(3)
+    emissions[0] = (cargo_weight_in_tons * _TRUCK_GRAMS_PER_TONMILE[0] + _TRUCK_GRAMS_PER_EMPTY_MILE[0]) * trip_miles
+    emissions[1] = (cargo_weight_in_tons * _TRUCK_GRAMS_PER_TONMILE[1] + _TRUCK_GRAMS_PER_EMPTY_MILE[1]) * trip_miles
+    emissions[2] = (cargo_weight_in_tons * _TRUCK_GRAMS_PER_TONMILE[2] + _TRUCK_GRAMS_PER_EMPTY_MILE[2]) * trip_miles
+    return emissions
+
+
+@cc.export('tanker_emissions', 'f8[:](f8, f8, f8)')
+def tanker_emissions(miles, cargo_weight, number_of_tankers):
+    trip_miles = miles * number_of_tankers
+    emissions = np.empty(3)
+    emissions[0] = (cargo_weight * _TANKER_GRAMS_PER_TONMILE[0] + _TANKER_GRAMS_PER_BACKHAUL_MILE[0]) * trip_miles
+    emissions[1] = (cargo_weight * _TANKER_GRAMS_PER_TONMILE[1] + _TANKER_GRAMS_PER_BACKHAUL_MILE[1]) * trip_miles
+    emissions[2] = (cargo_weight * _TANKER_GRAMS_PER_TONMILE[2] + _TANKER_GRAMS_PER_BACKHAUL_MILE[2]) * trip_miles
+    return emissions
+
+
+@cc.export('fuelused_emissions', 'f8[:](f8, f8)')
+def fuelused_emissions(miles_ocean_tanker, miles_truck):
+    emissions = np.empty(3)
+    emissions[0] = miles_ocean_tanker * _FUELUSED_GRAMS_PER_MILE_TANKER[0] + miles_truck * _FUELUSED_GRAMS_PER_MILE_TRUCK[0]
+    emissions[1] = miles_ocean_tanker * _FUELUSED_GRAMS_PER_MILE_TANKER[1] + miles_truck * _FUELUSED_GRAMS_PER_MILE_TRUCK[1]
+    emissions[2] = miles_ocean_tanker * _FUELUSED_GRAMS_PER_MILE_TANKER[2] + miles_truck * _FUELUSED_GRAMS_PER_MILE_TRUCK[2]
+    return emissions
+
+
+@cc.export('three_leg_emissions', 'f8[:](f8, f8, f8)')
+def three_leg_emissions(cargo_weight, truck_miles, truck_quantity):
+    emissions = np.empty(3)
+    emissions[0] = (cargo_weight * (_SCENARIO_TANKER_GRAMS_PER_TON[0] + _TRUCK_GRAMS_PER_TONMILE[0] * truck_miles)
+                    + _SCENARIO_TANKER_GRAMS_FIXED[0] + _TRUCK_GRAMS_PER_EMPTY_MILE[0] * truck_miles * truck_quantity)
+    emissions[1] = (cargo_weight * (_SCENARIO_TANKER_GRAMS_PER_TON[1] + _TRUCK_GRAMS_PER_TONMILE[1] * truck_miles)
+                    + _SCENARIO_TANKER_GRAMS_FIXED[1] + _TRUCK_GRAMS_PER_EMPTY_MILE[1] * truck_miles * truck_quantity)
+    emissions[2] = (cargo_weight * (_SCENARIO_TANKER_GRAMS_PER_TON[2] + _TRUCK_GRAMS_PER_TONMILE[2] * truck_miles)
+                    + _SCENARIO_TANKER_GRAMS_FIXED[2] + _TRUCK_GRAMS_PER_EMPTY_MILE[2] * truck_miles * truck_quantity)
+    return emissions
+
+
+@cc.export('diesel_production_emissions', 'f8[:](f8)')
+def diesel_production_emissions(gallons_diesel):
+    emissions = np.empty(3)
+    emissions[0] = gallons_diesel * _DIESEL_PRODUCTION_GRAMS_PER_GALLON[0]
+    emissions[1] = gallons_diesel * _DIESEL_PRODUCTION_GRAMS_PER_GALLON[1]
+    emissions[2] = gallons_diesel * _DIESEL_PRODUCTION_GRAMS_PER_GALLON[2]
+    return emissions
+
+
+if __name__ == '__main__':
+    cc.compile()
@@ -39,8 +39,210 @@ Functions:
 - transportation_scenario_emissions(target_solar, turbine_power, target_wind, target_bess_power,
   target_bess_energy, target_diesel): Calculates total emissions for transporting solar panels, wind turbines,
   battery storage units, and diesel based on assumed weight and transportation mode emissions.
+
+- transportation_scenario_emissions_batched(target_solar, turbine_power, target_wind, target_bess_power,
+  target_bess_energy, target_diesel): NumPy-broadcasting variant of transportation_scenario_emissions for
+  parameter sweeps; accepts arrays for any input and returns arrays per pollutant.
+
+- to_dict(emissions_vector): Converts a 3-element (CO2, CH4, N2O) emissions vector into a pollutant
+  dictionary for callers that want named keys.
+
+- make_scenario_emitter(turbine_power, ...): Returns a closure specialized to fixed design constants
+  that evaluates the transportation scenario from just the four target_* values, with all other
+  terms folded into precomputed linear coefficients.
+
+Internally, emissions are carried as fixed 3-element NumPy float64 vectors ordered (CO2, CH4, N2O);
+EMISSIONS_IDX maps pollutant names to vector positions.
 """
 
+import functools
+import types
+from collections.abc import Mapping
+
+import numpy as np
+
+try:
+    from numba import njit
+except ImportError:
+    #Numba is optional; without it the kernels below run as plain Python
+    def njit(*args, **kwargs):
+        def decorate(func):
+            return func
+        return decorate
+
+
+#Fixed pollutant ordering for the internal 3-vector emissions representation
+POLLUTANTS = ('CO2', 'CH4', 'N2O')
+EMISSIONS_IDX = {'CO2': 0, 'CH4': 1, 'N2O': 2}
+
+
+def to_dict(emissions_vector):
+    """
+    Convert a 3-element (CO2, CH4, N2O) emissions vector into a pollutant dictionary.
+
+    Parameters:
+    - emissions_vector (np.ndarray): 3-element array ordered (CO2, CH4, N2O).
+
+    Returns:
+    - dict: Dictionary with 'CO2', 'CH4', and 'N2O' keys and float values.
+    """
+    return {'CO2': float(emissions_vector[0]), 'CH4': float(emissions_vector[1]), 'N2O': float(emissions_vector[2])}
+
+
+def _as_vector(emissions):
+    """
+    Normalize an emissions value to the fixed (CO2, CH4, N2O) 3-vector.
+
+    Accepts an existing 3-vector, a pollutant mapping such as a dict or a read-only
+    types.MappingProxyType (missing pollutants count as zero), or a bare scalar, which is
+    treated as a CO2-only value.
+    """
+    if isinstance(emissions, Mapping):
+        return np.array([emissions.get(pollutant, 0.0) for pollutant in POLLUTANTS])
+    if np.ndim(emissions) == 0:
+        return np.array([float(emissions), 0.0, 0.0])
+    return np.asarray(emissions, dtype=np.float64)
+
+
+#Truck constants (per GREET)
+ENERGY_INTENSITY_TRUCK = 684  #Btu/ton-mile for the loaded trip from origin to destination
+BTU_PER_MILE_EMPTY_TRUCK = 13567  #Btu/mile for the empty return trip
+
+#Emissions factors for the truck in grams per mmBtu, ordered (CO2, CH4, N2O) (per GREET)
+EMISSIONS_FACTORS_TRUCK = (89.77044869, 0.109408298, 0.000355609)
+
+#Ocean tanker constants (per GREET)
+ENERGY_INTENSITY_TANKER = 43  #Btu/ton-mile for the loaded trip from origin to destination
+LOAD_FACTOR_TANKER_BACK_HAUL = 0.70  #70% of the hp is used on the empty back-haul
+HP_TANKER = 19170  #Horsepower for the ocean tanker
+AVERAGE_SPEED_TANKER = 20  #Average speed in miles per hour for the ocean tanker (GREET)
+ENERGY_CONSUMPTION_TANKER = 5439  #Ocean tanker's energy consumption (Btu/hphr)
+
+#Btu/mile for the empty tanker back-haul, folded once from the constants above
+BTU_PER_MILE_TANKER_BACK_HAUL = (ENERGY_CONSUMPTION_TANKER * HP_TANKER * LOAD_FACTOR_TANKER_BACK_HAUL) / AVERAGE_SPEED_TANKER
+
+#Emissions factors for the ocean tanker in grams per mmBtu, ordered (CO2, CH4, N2O)
+EMISSIONS_FACTORS_TANKER = (262.9991694, 0.293135661, 0.006037729)
+
+#Fuel energy content
+BTU_PER_GALLON_DIESEL = 138700  #Btu per gallon of diesel (approximate, from EPA website)
+BTU_PER_GALLON_RESID = 149700  #Btu per gallon of residual oil (per Google, source: EPA [5])
+
+#Emissions factors for fuel production in grams per mmBtu, ordered (CO2, CH4, N2O)
+EMISSIONS_FACTORS_DIESEL_PRODUCTION = (12747.98, 109.519, 0.233)
+EMISSIONS_FACTORS_RESID_PRODUCTION = (9670.93, 100.419, 0.162)
+
+#Fuel-consumption assumptions for calculate_fuelused_emissions
+ENGINE_EFFICIENCY_TANKER = 0.50  #Assumed average engine efficiency for the tanker (Googled, Source: C2E2, typically 45-52%)
+MPG_TRUCK = 5.6  #Average MPG for trucks (Googled, Source: EPA)
+
+#Diesel production coefficients in grams per gallon, folded from the per-mmBtu factors
+_DIESEL_PRODUCTION_GRAMS_PER_GALLON = tuple(
+    factor * BTU_PER_GALLON_DIESEL / 1e6 for factor in EMISSIONS_FACTORS_DIESEL_PRODUCTION
+)
+
+#Fuel-production coefficients in grams per mile travelled, folding each vehicle's fuel burn
+#per mile (mmBtu) into the production factors above
+_FUELUSED_MMBTU_PER_MILE_TANKER = (ENERGY_CONSUMPTION_TANKER / (BTU_PER_GALLON_RESID * ENGINE_EFFICIENCY_TANKER)
+                                   / AVERAGE_SPEED_TANKER * BTU_PER_GALLON_RESID / 1e6)
+_FUELUSED_MMBTU_PER_MILE_TRUCK = BTU_PER_GALLON_DIESEL / MPG_TRUCK / 1e6
+_FUELUSED_GRAMS_PER_MILE_TANKER = tuple(
+    factor * _FUELUSED_MMBTU_PER_MILE_TANKER for factor in EMISSIONS_FACTORS_RESID_PRODUCTION
+)
+_FUELUSED_GRAMS_PER_MILE_TRUCK = tuple(
+    factor * _FUELUSED_MMBTU_PER_MILE_TRUCK for factor in EMISSIONS_FACTORS_DIESEL_PRODUCTION
+)
+
+#Transportation scenario constants
+PV_G_KW = 160  #Weight of PV systems in grams per kW (assumed from paper)
+BESS_CONTAINER_WEIGHT_KG = 18000  #For 20 ft container from MicroGreen
+BESS_ENERGY_CAPACITY_KWH = 1240
+NPS_100C_24_WEIGHT = 19.8  #Weight of one Nps100c-24 wind turbine in tons (Googled, Source: 10)
+GRAMS_PER_TON = 907185
+
+#One-way leg distances shared by every component in the transportation scenario (miles)
+TANKER_LEG_1_MILES = 6900  #First tanker leg, single tanker carrying the full cargo
+TANKER_LEG_2_MILES = 2415  #Second leg, cargo split evenly between the tanker and the icebreaker
+
+#Per-leg emission coefficients folded at import (partial evaluation), ordered (CO2, CH4, N2O):
+#grams per ton-mile for the loaded leg and grams per mile for the empty leg. With these, each
+#kernel call reduces to one multiply-add per pollutant.
+_TRUCK_GRAMS_PER_TONMILE = tuple(factor * ENERGY_INTENSITY_TRUCK / 1e6 for factor in EMISSIONS_FACTORS_TRUCK)
+_TRUCK_GRAMS_PER_EMPTY_MILE = tuple(factor * BTU_PER_MILE_EMPTY_TRUCK / 1e6 for factor in EMISSIONS_FACTORS_TRUCK)
+_TANKER_GRAMS_PER_TONMILE = tuple(factor * ENERGY_INTENSITY_TANKER / 1e6 for factor in EMISSIONS_FACTORS_TANKER)
+_TANKER_GRAMS_PER_BACKHAUL_MILE = tuple(factor * BTU_PER_MILE_TANKER_BACK_HAUL / 1e6 for factor in EMISSIONS_FACTORS_TANKER)
+
+#Scenario-level fusion of the two tanker legs: the loaded term covers 6900 + 2415 miles (the
+#/2 cargo split and the x2 tanker count cancel on the second leg) and the empty back-haul
+#covers 6900 + 2*2415 miles because two vessels return from the second leg.
+_SCENARIO_TANKER_GRAMS_PER_TON = tuple(
+    coefficient * (TANKER_LEG_1_MILES + TANKER_LEG_2_MILES) for coefficient in _TANKER_GRAMS_PER_TONMILE
+)
+_SCENARIO_TANKER_GRAMS_FIXED = tuple(
+    coefficient * (TANKER_LEG_1_MILES + 2 * TANKER_LEG_2_MILES) for coefficient in _TANKER_GRAMS_PER_BACKHAUL_MILE
+)
+
+
+#Compiled kernels for the per-call hot paths. Each returns a 3-element float64 array
+#ordered (CO2, CH4, N2O); the public functions below wrap them back into dicts.
+#cache=True persists the compiled code on disk so repeat sessions skip the compile hit.
+
+@njit(cache=True, fastmath=True)
+def _truck_emissions_kernel(miles, cargo_weight_in_tons, quantity):
+    trip_miles = miles * quantity
+    emissions = np.empty(3)
+    emissions[0] = (cargo_weight_in_tons * _TRUCK_GRAMS_PER_TONMILE[0] + _TRUCK_GRAMS_PER_EMPTY_MILE[0]) * trip_miles
+    emissions[1] = (cargo_weight_in_tons * _TRUCK_GRAMS_PER_TONMILE[1] + _TRUCK_GRAMS_PER_EMPTY_MILE[1]) * trip_miles
+    emissions[2] = (cargo_weight_in_tons * _TRUCK_GRAMS_PER_TONMILE[2] + _TRUCK_GRAMS_PER_EMPTY_MILE[2]) * trip_miles
+    return emissions
+
+
+@njit(cache=True, fastmath=True)
+def _tanker_emissions_kernel(miles, cargo_weight, number_of_tankers):
+    trip_miles = miles * number_of_tankers
+    emissions = np.empty(3)
+    emissions[0] = (cargo_weight * _TANKER_GRAMS_PER_TONMILE[0] + _TANKER_GRAMS_PER_BACKHAUL_MILE[0]) * trip_miles
+    emissions[1] = (cargo_weight * _TANKER_GRAMS_PER_TONMILE[1] + _TANKER_GRAMS_PER_BACKHAUL_MILE[1]) * trip_miles
+    emissions[2] = (cargo_weight * _TANKER_GRAMS_PER_TONMILE[2] + _TANKER_GRAMS_PER_BACKHAUL_MILE[2]) * trip_miles
+    return emissions
+
+
+@njit(cache=True, fastmath=True)
+def _fuelused_emissions_kernel(miles_ocean_tanker, miles_truck):
+    emissions = np.empty(3)
+    emissions[0] = miles_ocean_tanker * _FUELUSED_GRAMS_PER_MILE_TANKER[0] + miles_truck * _FUELUSED_GRAMS_PER_MILE_TRUCK[0]
+    emissions[1] = miles_ocean_tanker * _FUELUSED_GRAMS_PER_MILE_TANKER[1] + miles_truck * _FUELUSED_GRAMS_PER_MILE_TRUCK[1]
+    emissions[2] = miles_ocean_tanker * _FUELUSED_GRAMS_PER_MILE_TANKER[2] + miles_truck * _FUELUSED_GRAMS_PER_MILE_TRUCK[2]
+    return emissions
+
+
+@njit(cache=True, fastmath=True)
+def _three_leg_kernel(cargo_weight, truck_miles, truck_quantity):
+    #Fused form of both tanker legs plus the truck leg for one scenario component;
+    #mirrors _three_leg_emissions with the per-leg constants folded in
+    emissions = np.empty(3)
+    emissions[0] = (cargo_weight * (_SCENARIO_TANKER_GRAMS_PER_TON[0] + _TRUCK_GRAMS_PER_TONMILE[0] * truck_miles)
+                    + _SCENARIO_TANKER_GRAMS_FIXED[0] + _TRUCK_GRAMS_PER_EMPTY_MILE[0] * truck_miles * truck_quantity)
+    emissions[1] = (cargo_weight * (_SCENARIO_TANKER_GRAMS_PER_TON[1] + _TRUCK_GRAMS_PER_TONMILE[1] * truck_miles)
+                    + _SCENARIO_TANKER_GRAMS_FIXED[1] + _TRUCK_GRAMS_PER_EMPTY_MILE[1] * truck_miles * truck_quantity)
+    emissions[2] = (cargo_weight * (_SCENARIO_TANKER_GRAMS_PER_TON[2] + _TRUCK_GRAMS_PER_TONMILE[2] * truck_miles)
+                    + _SCENARIO_TANKER_GRAMS_FIXED[2] + _TRUCK_GRAMS_PER_EMPTY_MILE[2] * truck_miles * truck_quantity)
+    return emissions
+
+
+#Prefer the ahead-of-time compiled kernels when the optional south_pole_aot extension is
+#available (built with build_south_pole_aot.py); they skip the first-call JIT compile cost.
+#Without it, the @njit (or plain Python) kernels above are used unchanged.
+try:
+    import south_pole_aot as _aot
+except ImportError:
+    pass
+else:
+    _truck_emissions_kernel = _aot.truck_emissions
+    _tanker_emissions_kernel = _aot.tanker_emissions
+    _fuelused_emissions_kernel = _aot.fuelused_emissions
+    _three_leg_kernel = _aot.three_leg_emissions
+
 
 def calculate_truck_emissions(miles, cargo_weight_in_tons, quantity):
     """
@@ -53,58 +255,28 @@ def calculate_truck_emissions(miles, cargo_weight_in_tons, quantity):
     - quantity (int): The number of trips made.
 
     Returns:
-    - dict: A dictionary containing the total emissions for CO2, CH4, and N2O in grams, 
-            calculated over the specified number of round trips.
+    - np.ndarray: A 3-element array with the total emissions for (CO2, CH4, N2O) in grams,
+                  calculated over the specified number of round trips. Use to_dict for a
+                  pollutant dictionary.
 
     Note:
     - This function calculates truck emissions based on energy intensity values for loaded and empty trips.
     - Energy intensity for the loaded trip is given in Btu per ton-mile, reflecting the energy used per ton of cargo per mile.
     - The energy consumption for the empty return trip is specified directly in Btu per mile.
-    - Emissions are calculated using the Btu values converted to gallons of diesel burned per mile, then multiplied by the emissions factors for each pollutant per mmBtu of diesel consumed.
+    - Emissions are calculated from the total mmBtu of diesel consumed over the loaded and empty trips, multiplied by the emissions factors for each pollutant per mmBtu.
     - The function sums the emissions from the loaded and empty trips, then multiplies by the number of trips to give total emissions for the journey.
 
     Example:
     emissions = calculate_truck_emissions(1000, 20, 5)
     print("Total emissions for 5 round trips with 20 tons cargo over 1000 miles:")
-    for pollutant, total in emissions.items():
+    for pollutant, total in to_dict(emissions).items():
         print(f"{pollutant}: {total} grams")
     """
 
-    btu_per_gallon_diesel = 138700  # Btu per gallon of diesel (approximate, from EPS website)
-
-    #Truck's energy intensity for the journey from origin to destination (Btu/ton-mile, per GREET)
-    energy_intensity_truck_origin_to_destination = 684
-    btu_per_mile_empty = 13567  # Btu/mile for the empty trip (given by GREET)
-
-    #Emissions factors for the truck (grams per mmBtu, per GREET)
-    emissions_factors_truck = {
-        "CO2": 89.77044869,
-        "CH4": 0.109408298,
-        "N2O": 0.000355609
-    }
-
-    #Calculate BTU per mile for the loaded truck
-    btu_per_mile_truck_origin_to_destination = energy_intensity_truck_origin_to_destination * cargo_weight_in_tons
-
-    #Convert BTU per mile to gallons per mile for the loaded trip
-    gallons_per_mile_truck_origin_to_destination = btu_per_mile_truck_origin_to_destination / btu_per_gallon_diesel
-
-    #Use the btu_per_mile_empty for the empty trip
-    gallons_per_mile_empty = btu_per_mile_empty / btu_per_gallon_diesel
-
-    #Initialize a dictionary to hold total emissions for the trip
-    total_emissions = {}
-
-    #Calculate total emissions for the trip
-    for emission, factor in emissions_factors_truck.items():
-        #Emissions for the loaded trip to the destination
-        emissions_origin_to_destination = factor * gallons_per_mile_truck_origin_to_destination * btu_per_gallon_diesel / 1e6 * miles
-        #Emissions for the empty trip back to origin
-        emissions_empty_back = factor * gallons_per_mile_empty * btu_per_gallon_diesel / 1e6 * miles
-        #Sum up both emissions and multiply by the quantity of trips
-        total_emissions[emission] = (emissions_origin_to_destination + emissions_empty_back) * quantity
-
-    return total_emissions
+    #Total fuel energy for the journey in mmBtu. Converting Btu/mile to gallons/mile and back
+    #(dividing then multiplying by Btu/gallon of diesel) cancels algebraically, so the loaded
+    #and empty Btu/mile figures convert straight to mmBtu over the trip.
+    return _truck_emissions_kernel(miles, cargo_weight_in_tons, quantity)
 
 
 def calculate_co2_equivalent(emissions_dictionary):
@@ -112,8 +284,9 @@ def calculate_co2_equivalent(emissions_dictionary):
     Calculate the CO2-equivalent emissions for given masses of CO2, CH4, and N2O over a 100-year timeline using AR6 Global Warming Potentials (GWP100).
 
     Parameters:
-    - emissions (dict): Dictionary containing the mass of CO2, CH4, and N2O emissions in kilograms.
-      The dictionary should have keys 'CO2', 'CH4', and 'N2O'.
+    - emissions (dict or np.ndarray): The mass of CO2, CH4, and N2O emissions in kilograms, either
+      as a dictionary with keys 'CO2', 'CH4', and 'N2O' or as a 3-element (CO2, CH4, N2O) emissions
+      vector as returned by the calculate_* functions.
 
     Returns:
     - float: The total CO2-equivalent emissions in kilograms.
@@ -122,6 +295,8 @@ def calculate_co2_equivalent(emissions_dictionary):
     - This function calculates CO2-equivalent emissions using the Global Warming Potentials (GWP100) from the AR6 report.
     - The GWP100 values used are 1 for CO2, 29.8 for CH4, and 273 for N2O.
     - CO2-equivalent emissions are calculated by multiplying the mass of each gas by its respective GWP100 value and summing the results.
+    - The input is normalized with _as_vector, so emissions vectors, pollutant dictionaries, and
+      the outputs of sum_emissions all compose with this function directly.
     - The function returns the total CO2-equivalent emissions in kilograms.
 
     Example:
@@ -129,10 +304,12 @@ def calculate_co2_equivalent(emissions_dictionary):
     total_co2_eq = calculate_co2_equivalent(emissions_data)
     print(total_co2_eq)  # Output: Total CO2-equivalent emissions for the given masses
     """
-    
-    co2_eq_co2 = emissions_dictionary['CO2'] * 1
-    co2_eq_ch4 = emissions_dictionary['CH4'] * 29.8
-    co2_eq_n2o = emissions_dictionary['N2O'] * 273
+
+    emissions_vector = _as_vector(emissions_dictionary)
+
+    co2_eq_co2 = emissions_vector[0] * 1
+    co2_eq_ch4 = emissions_vector[1] * 29.8
+    co2_eq_n2o = emissions_vector[2] * 273
     total_co2_eq = co2_eq_co2 + co2_eq_ch4 + co2_eq_n2o
 
     return total_co2_eq
@@ -148,7 +325,9 @@ def calculate_tanker_emissions(miles, cargo_weight, number_of_tankers):
     - number_of_tankers (int): Number of tankers making the trip.
 
     Returns:
-    - dict: A dictionary containing the cumulative emissions of CO2, CH4, and N2O in grams for the round trip, multiplied by the number of tankers.
+    - np.ndarray: A 3-element array with the cumulative emissions of (CO2, CH4, N2O) in grams for
+                  the round trip, multiplied by the number of tankers. Use to_dict for a pollutant
+                  dictionary.
 
     Note:
     - The function calculates emissions based on different fuel consumption rates when the tanker is loaded versus when it returns empty.
@@ -159,50 +338,14 @@ def calculate_tanker_emissions(miles, cargo_weight, number_of_tankers):
     Example:
     emissions = calculate_tanker_emissions(5000, 300, 2)
     print("Emissions for 2 tankers on a 5000-mile journey with 300 tons cargo:")
-    for pollutant, emissions in emissions.items():
+    for pollutant, emissions in to_dict(emissions).items():
         print(f"{pollutant}: {emissions} grams")
     """
 
-    btu_per_gallon_residual_oil = 149700  # Approximate Btu per gallon of residual oil (per Google, source: EPA [5])
-
-    #Ocean tanker's energy intensity for the journey from origin to destination (Btu/ton-mile)
-    energy_intensity_tanker_origin_to_destination = 43
-
-    #Ocean tanker's load factor for the empty back-haul
-    load_factor_tanker_back_haul = 0.70  # 70% of the hp is used
-
-    #Hard-coded ocean tanker's horsepower and average speed
-    hp_tanker = 19170  #Horsepower for the ocean tanker
-    average_speed_tanker = 20  #Average speed in miles per hour for the ocean tanker (GREET)
-
-    #Ocean tanker's energy consumption (Btu/hphr)
-    energy_consumption_tanker = 5439
-
-    #Emissions factors for the ocean tanker (grams per mmBtu)
-    emissions_factors_tanker = {
-        "CO2": 262.9991694,
-        "CH4": 0.293135661,
-        "N2O": 0.006037729
-    }
-
-    #Calculate BTU per mile for the loaded ocean tanker using Btu/ton-mile
-    btu_per_mile_tanker_origin_to_destination = energy_intensity_tanker_origin_to_destination * cargo_weight
-
-    #Calculate Btu per mile for the empty ocean tanker using energy consumption, load factor, and average speed
-    btu_per_mile_tanker_back_haul = (energy_consumption_tanker * hp_tanker * load_factor_tanker_back_haul) / average_speed_tanker
-
-    #Convert Btu per mile to gallons per mile for the ocean tanker
-    gallons_per_mile_tanker_origin_to_destination = btu_per_mile_tanker_origin_to_destination / btu_per_gallon_residual_oil
-    gallons_per_mile_tanker_back_haul = btu_per_mile_tanker_back_haul / btu_per_gallon_residual_oil
-
-    #Calculate total emissions for the trip for one tanker
-    total_emissions = {}
-    for pollutant, factor in emissions_factors_tanker.items():
-        emissions_origin_to_destination = factor * gallons_per_mile_tanker_origin_to_destination * btu_per_gallon_residual_oil / 1e6 * miles
-        emissions_back_haul = factor * gallons_per_mile_tanker_back_haul * btu_per_gallon_residual_oil / 1e6 * miles
-        total_emissions[pollutant] = (emissions_origin_to_destination + emissions_back_haul) * number_of_tankers
-
-    return total_emissions
+    #Total fuel energy for the round trip in mmBtu, combining the loaded leg (Btu/ton-mile)
+    #and the empty back-haul (Btu/mile). The gallons-of-residual-oil conversion cancels
+    #algebraically (divide then multiply by Btu/gallon), so it is folded out in the kernel.
+    return _tanker_emissions_kernel(miles, cargo_weight, number_of_tankers)
 
 
 def calculate_fuelused_emissions(miles_ocean_tanker, miles_truck):
@@ -214,58 +357,17 @@ def calculate_fuelused_emissions(miles_ocean_tanker, miles_truck):
     - miles_truck (float): The total distance traveled by the truck in miles.
 
     Returns:
-    - dict: A dictionary containing the combined emissions from fuel consumption for the ocean tanker and the truck, broken down by pollutant.
-    """
-    
-    #Constants
-    btu_per_gallon_diesel = 138700  #BTU per gallon for diesel per EPA
-    btu_per_gallon_resid = 149700  #BTU per gallon for resid 
-    energy_consumption_btu_hphr = 5439  
-    engine_efficiency = 0.50  #Assumed average engine efficiency for the tanker (Googled, Source: C2E2, typically 45-52%)
-    average_speed_mph_tanker = 20  
-    mpg_truck = 5.6 #Average MPG for trucks (Googled, Source: EPA)
-
-    #Calculate gallons of fuel consumed per hour per horsepower for the tanker
-    gallons_per_hour_per_hp_tanker = energy_consumption_btu_hphr / (btu_per_gallon_resid * engine_efficiency)
-    mpg_tanker = average_speed_mph_tanker / gallons_per_hour_per_hp_tanker
-
-    #Gallons per mile (inverse of MPG for calculation purposes)
-    gallons_per_mile_tanker = 1.0 / mpg_tanker
-    gallons_per_mile_truck = 1.0 / mpg_truck
-
-    #Calculate total fuel consumption in gallons for each vehicle
-    total_fuel_consumption_tanker = miles_ocean_tanker * gallons_per_mile_tanker
-    total_fuel_consumption_truck = miles_truck * gallons_per_mile_truck
-
-    #Convert total fuel consumption to mmBtu
-    total_fuel_consumption_mmBtu_tanker = total_fuel_consumption_tanker * btu_per_gallon_resid / 1e6
-    total_fuel_consumption_mmBtu_truck = total_fuel_consumption_truck * btu_per_gallon_diesel / 1e6
-
-    #Emissions factors for fuel production (grams per mmBtu)
-    emissions_factors = {
-        'diesel': {
-            'CO2': 12747.98, 
-            'CH4': 109.519,  
-            'N2O': 0.233,  
-        },
-        'resid': {
-            'CO2': 9670.93,
-            'CH4': 100.419,
-            'N2O': 0.162,
-        }
-    }
-
-    #Initialize a dictionary to hold the combined emissions
-    combined_emissions = {'CO2': 0, 'CH4': 0, 'N2O': 0}
+    - np.ndarray: A 3-element array with the combined emissions of (CO2, CH4, N2O) from fuel
+                  consumption for the ocean tanker and the truck. Use to_dict for a pollutant
+                  dictionary.
 
-    #Calculate combined emissions for each pollutant
-    for pollutant in combined_emissions:
-        combined_emissions[pollutant] = (
-            total_fuel_consumption_mmBtu_tanker * emissions_factors['resid'][pollutant] +
-            total_fuel_consumption_mmBtu_truck * emissions_factors['diesel'][pollutant]
-        )
+    Note:
+    - Assumed constants: 138700 Btu/gallon diesel (EPA), 149700 Btu/gallon resid, 5439 Btu/hphr tanker
+      energy consumption, 50% tanker engine efficiency (Googled, Source: C2E2, typically 45-52%),
+      20 mph average tanker speed, and 5.6 average MPG for trucks (Googled, Source: EPA).
+    """
 
-    return combined_emissions
+    return _fuelused_emissions_kernel(miles_ocean_tanker, miles_truck)
 
 
 def calculate_emissions_from_diesel(gallons_diesel):
@@ -276,34 +378,25 @@ def calculate_emissions_from_diesel(gallons_diesel):
     - gallons_diesel (float): The total amount of diesel fuel used in gallons.
 
     Returns:
-    - dict: A dictionary containing the emissions from the production of diesel fuel, broken down by pollutant.
+    - np.ndarray: A 3-element array with the emissions of (CO2, CH4, N2O) in grams from the
+                  production of the diesel fuel. Use to_dict for a pollutant dictionary.
 
     Note:
     - This function calculates emissions from the production of diesel fuel based on the amount of diesel used and emissions factors for diesel production.
-    - Emissions factors are provided for CO2, CH4, and N2O emissions per mmBtu of diesel produced.
-    - Emissions are calculated in grams for each pollutant emitted during the production of the specified amount of diesel fuel.
-    - The function returns a dictionary containing emissions for each pollutant emitted during the production of diesel fuel.
+    - The per-mmBtu production factors and the Btu content per gallon are folded at import into
+      grams-per-gallon coefficients, so each call is one multiply per pollutant.
 
     Example:
     emissions = calculate_emissions_from_diesel(124000)
-    for pollutant, total in emissions.items():
+    for pollutant, total in to_dict(emissions).items():
         print(f"Emissions of {pollutant} from the production of diesel: {total} grams")
     """
-    
-    btu_per_gallon_diesel = 138700
-
-    #Emissions factors for diesel production (grams per mmBtu)
-    emissions_factors_diesel = {
-        'CO2': 12747.98, 
-        'CH4': 109.519,  
-        'N2O': 0.233,  
-    }
 
-    #Convert total gallons of diesel to mmBtu
-    total_energy_mmBtu = gallons_diesel * btu_per_gallon_diesel / 1e6
-    emissions_from_diesel_fuel_used = {pollutant: total_energy_mmBtu * factor for pollutant, factor in emissions_factors_diesel.items()}
-
-    return emissions_from_diesel_fuel_used
+    return np.array([
+        gallons_diesel * _DIESEL_PRODUCTION_GRAMS_PER_GALLON[0],
+        gallons_diesel * _DIESEL_PRODUCTION_GRAMS_PER_GALLON[1],
+        gallons_diesel * _DIESEL_PRODUCTION_GRAMS_PER_GALLON[2]
+    ])
 
 
 def embodied_renewable_emissions(target_solar, target_wind, target_bess_energy, target_diesel):
@@ -317,88 +410,74 @@ def embodied_renewable_emissions(target_solar, target_wind, target_bess_energy,
     - target_diesel (float): The target amount of diesel fuel used in gallons.
 
     Returns:
-    - dict: A dictionary containing the embodied emissions for each component (solar, wind, BESS, diesel), broken down by pollutant.
+    - dict: A dictionary containing the embodied emissions for each component (bess, solar, wind, diesel),
+            each a 3-element (CO2, CH4, N2O) emissions vector. The manufacturing factors for bess, solar,
+            and wind are CO2-equivalent figures, so those vectors carry the value in the CO2 slot with
+            zero CH4 and N2O.
 
     Note:
     - This function calculates the embodied emissions from the production of renewable energy components (solar panels, wind turbines, lithium-ion battery energy storage systems) and diesel fuel.
     - Emissions factors are provided for each component's production in kilograms of CO2 equivalent per unit of capacity (kWp for solar, kW for wind, kWh for BESS).
     - Emissions are calculated based on the target capacities and energy capacities of each component.
     - Emissions from diesel fuel production are calculated separately using the calculate_emissions_from_diesel function.
-    - The function returns a dictionary containing embodied emissions for each component and pollutant emitted during their production.
+    - Every component maps to a vector of the same shape, so consumers can reduce them without
+      per-component type checks.
 
     Example:
     embodied_emissions = embodied_renewable_emissions(180, 570, 3410, 5600)
     for component, emissions in embodied_emissions.items():
-        if component != 'diesel':
-            print(f"{component.capitalize()} production emissions: {emissions} g CO2E")
-        else:
-            print(f"{component.capitalize()} production emissions:")
-            for pollutant, amount in emissions.items():
-                print(f"  {pollutant}: {amount} g CO2E")
+        print(f"{component.capitalize()} production emissions: {to_dict(emissions)}")
     """
-    
+
     #Emissions factors in kg CO2E per unit capacity
     emissions_factor_bess = 220000  #g CO2E per kWh of lithium ion storage (From paper, Source: [6])
     emissions_factor_solar = 1100000  #g CO2E per kWp of solar panel capacity
     emissions_factor_wind = 683700  #g CO2E per kW of wind turbine capacity
 
-    embodied_emissions_bess = target_bess_energy * emissions_factor_bess 
-    embodied_emissions_solar = target_solar * emissions_factor_solar  
-    embodied_emissions_wind = target_wind * emissions_factor_wind  
-
-    #Diesel production emissions in grams, convert to kg
-    embodied_emissions_diesel = calculate_emissions_from_diesel(target_diesel)
-    embodied_emissions_diesel = {pollutant: total for pollutant, total in embodied_emissions_diesel.items()}
-
+    #Every component is a (CO2, CH4, N2O) vector so downstream consolidation is one
+    #branch-free reduction; the CO2E manufacturing factors occupy the CO2 slot
     total_embodied_emissions = {
-        'bess': embodied_emissions_bess,
-        'solar': embodied_emissions_solar,
-        'wind': embodied_emissions_wind,
-        'diesel': embodied_emissions_diesel
+        'bess': np.array([target_bess_energy * emissions_factor_bess, 0.0, 0.0]),
+        'solar': np.array([target_solar * emissions_factor_solar, 0.0, 0.0]),
+        'wind': np.array([target_wind * emissions_factor_wind, 0.0, 0.0]),
+        'diesel': calculate_emissions_from_diesel(target_diesel)
     }
 
     return total_embodied_emissions
 
 
-def sum_emissions(*emission_dicts):
+def sum_emissions(*emission_vectors):
     """
-    Aggregates emissions data from multiple dictionaries into a single dictionary.
+    Aggregates emissions data from multiple sources into a single emissions vector.
 
-    This function is designed to sum up the emissions values for the same pollutants from different
-    transportation scenarios or legs. It takes any number of emission dictionaries and combines their
-    contents, summing values for identical pollutant keys.
+    This function sums up the emissions for the same pollutants from different transportation
+    scenarios or legs. It takes any number of emissions values and reduces them with a single
+    vectorized addition instead of per-key dictionary merging.
 
     Parameters:
-    *emission_dicts (dict): Variable number of dictionary arguments where each dictionary represents
-                            emissions data for a specific transportation scenario or leg. Each dictionary
-                            should have pollutant names as keys and emission values as numeric values.
+    *emission_vectors: Variable number of emissions values, each either a 3-element
+                       (CO2, CH4, N2O) vector as returned by the calculate_* functions, or a
+                       pollutant dictionary (normalized with missing pollutants counted as zero).
 
     Returns:
-    dict: A dictionary containing the summed emissions for each pollutant across all provided dictionaries.
-          Pollutant names are the keys and the summed values are the numeric values.
+    np.ndarray: A 3-element array with the summed emissions for (CO2, CH4, N2O) across all
+                provided values. Use to_dict for a pollutant dictionary.
 
     Note:
-    - The function does not check the type of values in the dictionaries; it assumes all values associated with pollutants
-      are numeric and summable.
-    - Pollutants not present in all dictionaries are included in the output with their available summed values.
-    - This function does not modify the input dictionaries.
-    
-    Example Usage:
-    emissions_dict1 = {'CO2': 100, 'NOx': 50}
-    emissions_dict2 = {'CO2': 200, 'SOx': 30}
-    total_emissions = sum_emissions(emissions_dict1, emissions_dict2)
-    #Output: {'CO2': 300, 'NOx': 50, 'SOx': 30}
+    - This function does not modify its inputs.
 
+    Example Usage:
+    leg1 = calculate_tanker_emissions(6900, 139, 1)
+    leg2 = calculate_truck_emissions(1030, 2.2, 7)
+    total_emissions = sum_emissions(leg1, leg2)
+    #Output: array([CO2_total, CH4_total, N2O_total])
     """
 
-    total_emissions = {}
-    for emissions in emission_dicts:
-        for pollutant, amount in emissions.items():
-            if pollutant in total_emissions:
-                total_emissions[pollutant] += amount
-            else:
-                total_emissions[pollutant] = amount
-    return total_emissions
+    #Only mappings need normalizing; vectors and tuples feed the reduction directly
+    return np.add.reduce([
+        _as_vector(emissions) if isinstance(emissions, Mapping) else emissions
+        for emissions in emission_vectors
+    ])
 
 
 def consolidate_scenario_emissions(transport_emissions, additional_emissions):
@@ -407,35 +486,105 @@ def consolidate_scenario_emissions(transport_emissions, additional_emissions):
 
     Parameters:
     - transport_emissions (dict): A dictionary containing emissions data for various transport units,
-      where each key represents a transport unit and the value is another dictionary with pollutants as keys.
-    - additional_emissions (dict): A dictionary containing emissions data for other categories like bess, solar,
-      wind, and a nested dictionary for diesel which includes CO2, CH4, and N2O emissions.
+      where each key represents a transport unit and the value is a (CO2, CH4, N2O) emissions vector
+      or a pollutant mapping, as returned by transportation_scenario_emissions.
+    - additional_emissions (dict): A dictionary containing emissions data for other categories like bess,
+      solar, wind, and diesel, each a (CO2, CH4, N2O) emissions vector as returned by
+      embodied_renewable_emissions (pollutant mappings are also accepted).
 
     Returns:
     - dict: A dictionary with total emissions for CO2, CH4, and N2O across all categories.
     """
-    
-    # Initialize totals for each pollutant
-    total_emissions = {'CO2': 0, 'CH4': 0, 'N2O': 0}
-    
-    # Sum up emissions from the transport emissions dictionary
-    for unit_emissions in transport_emissions.values():
-        for pollutant, amount in unit_emissions.items():
-            total_emissions[pollutant] += amount
-
-    # Sum up emissions from the additional emissions dictionary
-    for key, value in additional_emissions.items():
-        if isinstance(value, dict):
-            # If the value is a dictionary, it contains emissions for diesel including CO2, CH4, and N2O
-            for pollutant, amount in value.items():
-                total_emissions[pollutant] += amount
-        else:
-            # Otherwise, it's directly a CO2 value for bess, solar, or wind
-            total_emissions['CO2'] += value
-
-    return total_emissions
 
+    #Every category normalizes to the (CO2, CH4, N2O) vector schema, so the whole
+    #consolidation is one reduction
+    vectors = [_as_vector(value) for value in transport_emissions.values()]
+    vectors += [_as_vector(value) for value in additional_emissions.values()]
+
+    return to_dict(np.add.reduce(vectors))
+
+
+def _three_leg_emissions(cargo_weight, truck_miles, truck_quantity):
+    """
+    Closed-form emissions for one component's three-leg journey (two tanker legs plus the
+    truck leg), linear in the cargo weight. Broadcasting-safe: accepts scalars or NumPy
+    arrays for every argument and returns a dictionary of matching shape per pollutant.
+
+    The expression is the algebraic sum of
+        calculate_tanker_emissions(TANKER_LEG_1_MILES, cargo_weight, 1)
+      + calculate_tanker_emissions(TANKER_LEG_2_MILES, cargo_weight / 2, 2)
+      + calculate_truck_emissions(truck_miles, cargo_weight / truck_quantity, truck_quantity)
+    with the per-leg constants folded together; _three_leg_kernel is the scalar compiled
+    counterpart and uses the same scenario coefficients.
+    """
+
+    #Cargo split across truck_quantity vehicles on the truck leg, each returning empty
+    truck_empty_miles = truck_miles * truck_quantity
+
+    return {
+        'CO2': (cargo_weight * (_SCENARIO_TANKER_GRAMS_PER_TON[0] + _TRUCK_GRAMS_PER_TONMILE[0] * truck_miles)
+                + _SCENARIO_TANKER_GRAMS_FIXED[0] + _TRUCK_GRAMS_PER_EMPTY_MILE[0] * truck_empty_miles),
+        'CH4': (cargo_weight * (_SCENARIO_TANKER_GRAMS_PER_TON[1] + _TRUCK_GRAMS_PER_TONMILE[1] * truck_miles)
+                + _SCENARIO_TANKER_GRAMS_FIXED[1] + _TRUCK_GRAMS_PER_EMPTY_MILE[1] * truck_empty_miles),
+        'N2O': (cargo_weight * (_SCENARIO_TANKER_GRAMS_PER_TON[2] + _TRUCK_GRAMS_PER_TONMILE[2] * truck_miles)
+                + _SCENARIO_TANKER_GRAMS_FIXED[2] + _TRUCK_GRAMS_PER_EMPTY_MILE[2] * truck_empty_miles)
+    }
+
+
+def transportation_scenario_emissions_batched(target_solar, turbine_power, target_wind, target_bess_power, target_bess_energy, target_diesel):
+    """
+    NumPy-broadcasting variant of transportation_scenario_emissions for parameter sweeps.
+
+    Accepts scalars or np.ndarray values for any of the inputs (shapes must broadcast
+    against each other) and evaluates the whole scenario with a handful of ufunc calls
+    instead of a Python loop over scenarios, so per-element interpreter overhead is
+    amortized across the sweep.
+
+    Parameters:
+    - target_solar (float or np.ndarray): Target capacity of solar panels in kW.
+    - turbine_power (float or np.ndarray): Power rating of each wind turbine in kW.
+    - target_wind (float or np.ndarray): Total targeted wind power in kW.
+    - target_bess_power (float or np.ndarray): Power capacity of each BESS unit in kW (not directly used).
+    - target_bess_energy (float or np.ndarray): Total energy capacity required for BESS units in kWh.
+    - target_diesel (float or np.ndarray): Total diesel volume in gallons.
+
+    Returns:
+    dict: Same nested component-to-pollutant-mapping layout as transportation_scenario_emissions,
+          but each pollutant value is an np.ndarray with the broadcast shape of the inputs.
+
+    Usage:
+    sweep = transportation_scenario_emissions_batched(np.linspace(100, 500, 100), 95, 570, 500, 3410, 5600)
+    print(sweep['pv_panels_transport']['CO2'])
+    """
+
+    target_solar = np.asarray(target_solar, dtype=np.float64)
+    turbine_power = np.asarray(turbine_power, dtype=np.float64)
+    target_wind = np.asarray(target_wind, dtype=np.float64)
+    target_bess_energy = np.asarray(target_bess_energy, dtype=np.float64)
+    target_diesel = np.asarray(target_diesel, dtype=np.float64)
+
+    #Number of wind turbines needed + weight
+    num_turbines = target_wind / turbine_power
+    total_weight_turbines = num_turbines * NPS_100C_24_WEIGHT
+
+    #Total grams for PV systems, converted to tons
+    total_tons_pv = target_solar * PV_G_KW / GRAMS_PER_TON
 
+    #Number of BESS units required and their total weight in tons (1 ton = 1000 kg)
+    num_bess_units = target_bess_energy / BESS_ENERGY_CAPACITY_KWH
+    total_weight_bess_tons = num_bess_units * (BESS_CONTAINER_WEIGHT_KG / 1000)
+
+    total_weight_diesel_tons = (target_diesel * 6.5) / 2000  # Convert lbs to tons
+
+    return {
+        'wind_turbines_transport': _three_leg_emissions(total_weight_turbines, 1030, num_turbines * 7),
+        'pv_panels_transport': _three_leg_emissions(total_tons_pv, 1030, 9),
+        'bess_units_transport': _three_leg_emissions(total_weight_bess_tons, 100, num_bess_units),
+        'diesel_transport': _three_leg_emissions(total_weight_diesel_tons, 1030, 9)
+    }
+
+
+@functools.lru_cache(maxsize=4096)
 def transportation_scenario_emissions(target_solar, turbine_power, target_wind, target_bess_power, target_bess_energy, target_diesel):
     """
     Calculates the total emissions from transporting various energy components: solar panels,
@@ -451,8 +600,10 @@ def transportation_scenario_emissions(target_solar, turbine_power, target_wind,
     - target_diesel (float): Total diesel volume in gallons.
 
     Returns:
-    dict: A dictionary containing total emissions for transporting each component type, keyed by
-          the component type. Each value is a dictionary of pollutant emissions.
+    types.MappingProxyType: A read-only mapping of total emissions for transporting each component
+          type, keyed by the component type. Each value is a read-only pollutant mapping with
+          'CO2', 'CH4', and 'N2O' keys, matching the nested layout of
+          transportation_scenario_emissions_batched.
 
     Usage:
     emissions = transportation_scenario_emissions(5000, 1000, 20000, 500, 10000, 2000)
@@ -460,70 +611,94 @@ def transportation_scenario_emissions(target_solar, turbine_power, target_wind,
 
     The emissions calculations assume the inclusion of different transport phases such as tanker and
     truck trips, where each phase contributes to the total emissions for a given energy component.
-    """
 
-    #Solar Panels
-    pv_g_kw = 160  #Assumed from paper
+    Note:
+    - The function is pure, so results are memoized with functools.lru_cache; solvers that
+      repeatedly revisit the same scenario (e.g. finite-difference derivatives around a baseline
+      point) skip the computation entirely on cache hits. The return value is immutable so cached
+      entries cannot be corrupted by callers.
+    """
 
-    #For 20 ft container from MicroGreen
-    bess_container_weight_kg = 18000
-    bess_energy_capacity_kwh = 1240
+    #Component weights, mirroring transportation_scenario_emissions_batched
 
-    #For the Nps100c-24 wind turbine
-    nps_100c_24_weight = 19.8  #Weight of one wind turbine in tons (Googled, Source: 10)
-    
     #Number of wind turbines needed + weight
     num_turbines = target_wind / turbine_power
-    total_weight_turbines = num_turbines * nps_100c_24_weight
-    
-    #Total grams for PV systems
-    total_grams_pv = target_solar * pv_g_kw
-    #Convert total grams to tons (assuming 1 ton = 907,185 grams)
-    total_tons_pv = total_grams_pv / 907185
-    
-    #Calculate the number of BESS units required based on the required energy capacity
-    num_bess_units = target_bess_energy / bess_energy_capacity_kwh
-    #Total weight for BESS units in tons (assuming 1 ton = 1000 kg)
-    total_weight_bess_tons = num_bess_units * (bess_container_weight_kg / 1000)
-    
+    total_weight_turbines = num_turbines * NPS_100C_24_WEIGHT
+
+    #Total grams for PV systems, converted to tons
+    total_tons_pv = target_solar * PV_G_KW / GRAMS_PER_TON
+
+    #Number of BESS units required and their total weight in tons (1 ton = 1000 kg)
+    num_bess_units = target_bess_energy / BESS_ENERGY_CAPACITY_KWH
+    total_weight_bess_tons = num_bess_units * (BESS_CONTAINER_WEIGHT_KG / 1000)
+
     total_weight_diesel_tons = (target_diesel * 6.5) / 2000  # Convert lbs to tons
 
-    #Wind Trip Emissions, travels through LC-130
-    wind_trip_emissions = sum_emissions(
-        calculate_tanker_emissions(6900, total_weight_turbines, 1),
-        #The icebreaker/second tanker holds no cargo for the second trip, thus the weight is "evenly" distributed amongst the 2
-        calculate_tanker_emissions(2415, total_weight_turbines/2, 2),
-        calculate_truck_emissions(1030, total_weight_turbines / (num_turbines * 7), num_turbines * 7)
-    )
-
-    #PV Trip Emissions, travels through SPoT
-    pv_trip_emissions = sum_emissions(
-        calculate_tanker_emissions(6900, total_tons_pv, 1),
-        calculate_tanker_emissions(2415, total_tons_pv/2, 2),
-        #The total cargo is split amongst all nine vehicles thus the division. The function is written in a way where the input cargo is assumed to be the weight carried
-        #by each # of vehicles
-        calculate_truck_emissions(1030, total_tons_pv/9, 9)
-    )
-
-    #BESS Trip Emissions, travels with LC-130
-    bess_trip_emissions = sum_emissions(
-        calculate_tanker_emissions(6900, total_weight_bess_tons, 1),
-        calculate_tanker_emissions(2415, total_weight_bess_tons/2, 2),
-        calculate_truck_emissions(100, total_weight_bess_tons / num_bess_units, num_bess_units)
-    )
-
-    #Diesel Trip Emissions, travels through SPoT
-    diesel_trip_emissions = sum_emissions(
-        calculate_tanker_emissions(6900, total_weight_diesel_tons, 1),
-        calculate_tanker_emissions(2415, total_weight_diesel_tons/2, 2),
-        calculate_truck_emissions(1030, total_weight_diesel_tons/9, 9)
-    )
-
-    total_emissions = {
-        'wind_turbines_transport': wind_trip_emissions,
-        'pv_panels_transport': pv_trip_emissions,
-        'bess_units_transport': bess_trip_emissions,
-        'diesel_transport': diesel_trip_emissions
-    }
+    #One fused kernel call per component covers both tanker legs and the truck leg.
+    #Read-only mappings at both levels keep the memoized result immutable while preserving
+    #the component -> pollutant layout of the batched entrypoint.
+    return types.MappingProxyType({
+        'wind_turbines_transport': types.MappingProxyType(to_dict(_three_leg_kernel(total_weight_turbines, 1030.0, num_turbines * 7))),
+        'pv_panels_transport': types.MappingProxyType(to_dict(_three_leg_kernel(total_tons_pv, 1030.0, 9.0))),
+        'bess_units_transport': types.MappingProxyType(to_dict(_three_leg_kernel(total_weight_bess_tons, 100.0, num_bess_units))),
+        'diesel_transport': types.MappingProxyType(to_dict(_three_leg_kernel(total_weight_diesel_tons, 1030.0, 9.0)))
+    })
+
+
+def make_scenario_emitter(turbine_power, pv_g_kw=PV_G_KW, bess_container_weight_kg=BESS_CONTAINER_WEIGHT_KG,
+                          bess_energy_capacity_kwh=BESS_ENERGY_CAPACITY_KWH, nps_100c_24_weight=NPS_100C_24_WEIGHT):
+    """
+    Build a scenario evaluator specialized to fixed design constants.
+
+    turbine_power (and the component weight assumptions) are design constants for nearly every
+    study, while the four target_* values are what optimizers and sweeps actually vary. This
+    factory folds the fixed constants into one linear (slope, intercept) coefficient pair per
+    component up front, so each call of the returned closure is a handful of multiply-adds with
+    no intermediate weight or quantity arithmetic.
+
+    Parameters:
+    - turbine_power (float): Power rating of each wind turbine in kW.
+    - pv_g_kw (float): Weight of PV systems in grams per kW.
+    - bess_container_weight_kg (float): Weight of one BESS container in kg.
+    - bess_energy_capacity_kwh (float): Energy capacity of one BESS container in kWh.
+    - nps_100c_24_weight (float): Weight of one wind turbine in tons.
+
+    Returns:
+    - callable: scenario_emitter(target_solar, target_wind, target_bess_energy, target_diesel)
+      returning the same component layout as transportation_scenario_emissions, with each value
+      a 3-element (CO2, CH4, N2O) emissions vector. Broadcasting-safe: the four targets may be
+      scalars or NumPy arrays.
+
+    Usage:
+    emitter = make_scenario_emitter(95)
+    emissions = emitter(180, 570, 3410, 5600)
+    """
+
+    tanker_grams_per_ton = np.array(_SCENARIO_TANKER_GRAMS_PER_TON)
+    tanker_grams_fixed = np.array(_SCENARIO_TANKER_GRAMS_FIXED)
+    truck_grams_per_tonmile = np.array(_TRUCK_GRAMS_PER_TONMILE)
+    truck_grams_per_empty_mile = np.array(_TRUCK_GRAMS_PER_EMPTY_MILE)
+
+    #Grams per ton of cargo for a full three-leg journey at each truck distance
+    grams_per_ton_1030 = tanker_grams_per_ton + truck_grams_per_tonmile * 1030.0
+    grams_per_ton_100 = tanker_grams_per_ton + truck_grams_per_tonmile * 100.0
+
+    #Each component's emissions are linear in its target: emissions = target * slope + intercept.
+    #Wind and BESS truck quantities scale with the target, so their empty-mile terms fold into
+    #the slope; PV and diesel run a fixed nine trucks, so theirs land in the intercept.
+    wind_slope = (nps_100c_24_weight * grams_per_ton_1030 + truck_grams_per_empty_mile * 1030.0 * 7.0) / turbine_power
+    solar_slope = (pv_g_kw / GRAMS_PER_TON) * grams_per_ton_1030
+    bess_slope = ((bess_container_weight_kg / 1000.0) * grams_per_ton_100
+                  + truck_grams_per_empty_mile * 100.0) / bess_energy_capacity_kwh
+    diesel_slope = (6.5 / 2000.0) * grams_per_ton_1030
+    nine_truck_intercept = tanker_grams_fixed + truck_grams_per_empty_mile * 1030.0 * 9.0
+
+    def scenario_emitter(target_solar, target_wind, target_bess_energy, target_diesel):
+        return {
+            'wind_turbines_transport': target_wind * wind_slope + tanker_grams_fixed,
+            'pv_panels_transport': target_solar * solar_slope + nine_truck_intercept,
+            'bess_units_transport': target_bess_energy * bess_slope + tanker_grams_fixed,
+            'diesel_transport': target_diesel * diesel_slope + nine_truck_intercept
+        }
 
-    return total_emissions
+    return scenario_emitter